@@ -1,8 +1,9 @@
 import re
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 
 from babel.core import Locale, UnknownLocaleError, get_global
-from babel.numbers import format_currency
+from babel.numbers import format_currency, parse_pattern
 from django import template
 from django.conf import settings
 from django.utils.safestring import mark_safe
@@ -13,6 +14,7 @@ from django_babel.templatetags.babel import currencyfmt
 register = template.Library()
 
 
+@lru_cache(maxsize=256)
 def get_currency_fraction(currency):
     fractions = get_global('currency_fractions')
     try:
@@ -22,50 +24,71 @@ def get_currency_fraction(currency):
     return fraction[0]
 
 
-def format_price(value, currency, html=False):
+def format_price(value, currency, html=False, language=None):
     """
     Format decimal value as currency
+
+    Uses the active language unless `language` is given, which lets callers
+    formatting many prices resolve it only once.
     """
     try:
         value = Decimal(value)
     except (TypeError, InvalidOperation):
         return ''
 
-    locale, locale_code = get_locale_data()
-    pattern = locale.currency_formats.get('standard').pattern
+    locale, locale_code = get_locale_data(language)
+    pattern = get_currency_pattern(locale_code, html=html)
+    result = format_currency(value, currency, format=pattern, locale=locale)
+    return mark_safe(result)
+
+
+@lru_cache(maxsize=512)
+def get_currency_pattern(locale_code, html=False):
+    """
+    Return compiled standard currency pattern for given locale
+    """
+    pattern = parse_locale(locale_code).currency_formats.get(
+        'standard').pattern
 
     if html:
         pattern = re.sub(
             '(\xa4+)', '<span class="currency">\\1</span>', pattern)
 
-    result = format_currency(
-        value, currency, format=pattern, locale=locale_code)
-    return mark_safe(result)
+    return parse_pattern(pattern)
 
 
-def get_locale_data():
-    language = get_language()
+def get_locale_data(language=None):
+    if not language:
+        language = get_language()
     if not language:
         language = settings.LANGUAGE_CODE
     locale_code = to_locale(language)
-    locale = None
-    try:
-        locale = Locale.parse(locale_code)
-    except (ValueError, UnknownLocaleError):
+    locale = parse_locale(locale_code)
+    if locale is None:
         # Invalid format or unknown locale
         # Fallback to the default language
         language = settings.LANGUAGE_CODE
         locale_code = to_locale(language)
-        locale = Locale.parse(locale_code)
+        locale = parse_locale(locale_code) or Locale.parse(locale_code)
     return locale, locale_code
 
 
+@lru_cache(maxsize=64)
+def parse_locale(locale_code):
+    """
+    Parse locale code, returning None for invalid or unknown locales
+    """
+    try:
+        return Locale.parse(locale_code)
+    except (ValueError, UnknownLocaleError):
+        return None
+
+
 @register.filter
 def amount(obj, format='text'):
+    value, currency = obj.amount, obj.currency
     if format == 'text':
-        return format_price(
-            obj.amount, obj.currency, html=False)
+        return format_price(value, currency, html=False)
     if format == 'html':
-        return format_price(
-            obj.amount, obj.currency, html=True)
-    return currencyfmt(obj.amount, obj.currency)
+        return format_price(value, currency, html=True)
+    return currencyfmt(value, currency)
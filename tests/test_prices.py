@@ -20,43 +20,46 @@ from .forms import (ModelForm, OptionalPriceForm,
 from .models import Model
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def money_fixture():
     return Money('10', 'USD')
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def money_with_decimals():
     return Money('10.20', 'USD')
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def price_fixture():
     return TaxedMoney(net=Money('10', 'USD'), gross=Money('15', 'USD'))
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def price_with_decimals():
     return TaxedMoney(net=Money('10.20', 'USD'), gross=Money('15', 'USD'))
 
 
+@pytest.fixture(scope='session')
+def btc_money_field():
+    return MoneyField(
+        'price', currency='BTC', default='5', max_digits=9, decimal_places=2)
+
+
 def test_money_field_init():
     field = MoneyField(
         currency='BTC', default='5', max_digits=9, decimal_places=2)
     assert field.get_default() == Money(5, 'BTC')
 
 
-def test_money_field_get_prep_value():
-    field = MoneyField(
-        'price', currency='BTC', default='5', max_digits=9, decimal_places=2)
-    assert field.get_prep_value(Money(5, 'BTC')) == Decimal(5)
-
-
-def test_money_field_get_db_prep_save():
-    field = MoneyField(
-        'price', currency='BTC', default='5', max_digits=9, decimal_places=2)
-    value = field.get_db_prep_save(Money(5, 'BTC'), connection)
-    assert value == '5.00'
+@pytest.mark.parametrize("method,args,expected_result", [
+    ('get_prep_value', (Money(5, 'BTC'),), Decimal(5)),
+    ('get_db_prep_save', (Money(5, 'BTC'), connection), '5.00'),
+    ('from_db_value', (7, None, None, None), Money(7, 'BTC')),
+    ('from_db_value', (None, None, None, None), None)])
+def test_money_field_methods(btc_money_field, method, args, expected_result):
+    result = getattr(btc_money_field, method)(*args)
+    assert result == expected_result
 
 
 def test_money_field_value_to_string():
@@ -65,38 +68,20 @@ def test_money_field_value_to_string():
     assert field.value_to_string(instance) == Decimal('30')
 
 
-def test_money_field_from_db_value():
-    field = MoneyField(
-        'price', currency='BTC', default='5', max_digits=9, decimal_places=2)
-    assert field.from_db_value(7, None, None, None) == Money(7, 'BTC')
-
-
-def test_money_field_from_db_value_handles_none():
-    field = MoneyField(
-        'price', currency='BTC', default='5', max_digits=9, decimal_places=2)
-    assert field.from_db_value(None, None, None, None) is None
-
-
-def test_money_field_from_db_value_checks_currency():
-    field = MoneyField(
-        'price', currency='BTC', default='5', max_digits=9, decimal_places=2)
+def test_money_field_from_db_value_checks_currency(btc_money_field):
     invalid = Money(1, 'USD')
     with pytest.raises(ValueError):
-        field.from_db_value(invalid, None, None, None)
+        btc_money_field.from_db_value(invalid, None, None, None)
 
 
-def test_money_field_from_db_value_checks_min_value():
-    field = MoneyField(
-        'price', currency='BTC', default='5', max_digits=9, decimal_places=2)
+def test_money_field_from_db_value_checks_min_value(btc_money_field):
     invalid = Money(1, 'USD')
     with pytest.raises(ValueError):
-        field.from_db_value(invalid, None, None, None)
+        btc_money_field.from_db_value(invalid, None, None, None)
 
 
-def test_money_field_formfield():
-    field = MoneyField(
-        'price', currency='BTC', default='5', max_digits=9, decimal_places=2)
-    form_field = field.formfield()
+def test_money_field_formfield(btc_money_field):
+    form_field = btc_money_field.formfield()
     assert isinstance(form_field, forms.MoneyField)
     assert form_field.currency == 'BTC'
     assert isinstance(form_field.widget, widgets.MoneyInput)
@@ -362,3 +347,16 @@ def test_get_currency_fraction_unknown_currency():
 def test_format_price_invalid_value():
     result = prices_i18n.format_price('invalid', 'USD')
     assert result == ''
+
+
+def test_get_currency_pattern_html():
+    pattern = prices_i18n.get_currency_pattern('en_US', html=True)
+    assert pattern.pattern == '<span class="currency">\xa4</span>#,##0.00'
+    assert prices_i18n.get_currency_pattern('en_US', html=True) is pattern
+
+
+def test_format_price_explicit_language(settings):
+    settings.LANGUAGE_CODE = 'en_US'
+    translation.activate('en_US')
+    result = prices_i18n.format_price(10, 'USD', language='zh_CN')
+    assert result == 'US$10.00'